@@ -1,7 +1,10 @@
 from __future__ import annotations
+from typing import Final
 
-DAYS_PER_WEEK = 7
-DAYS_PER_MONTH = 30  # simple forecast month length
+DAYS_PER_WEEK: Final = 7
+DAYS_PER_MONTH: Final = 30  # simple forecast month length
+
+WH_PER_KWH: Final = 1000.0
 
 def validate_price_per_kwh(price: float) -> None:
     if price <= 0:
@@ -17,7 +20,7 @@ def validate_device_values(wattage: float, hours: float) -> None:
 
 def daily_kwh(wattage_w: float, hours_per_day: float) -> float:
     # kWh = (W * hours) / 1000
-    return (wattage_w * hours_per_day) / 1000.0
+    return (wattage_w * hours_per_day) / WH_PER_KWH
 
 def cost_for_kwh(kwh: float, price_per_kwh: float) -> float:
     return kwh * price_per_kwh
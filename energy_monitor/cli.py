@@ -1,25 +1,35 @@
 from __future__ import annotations
+from typing import Tuple
 
-def prompt_float(prompt: str, min_value: float | None = None, allow_zero: bool = False) -> float:
-    while True:
-        raw = input(prompt).strip()
-        try:
-            val = float(raw)
-        except ValueError:
-            print("Invalid number. Try again (example: 0.12).")
-            continue
+def _parse_float(raw: str, min_value: float | None, allow_zero: bool) -> Tuple[float | None, str]:
+    # (value, "") when raw is acceptable, otherwise (None, message for the user)
+    try:
+        val = float(raw)
+    except ValueError:
+        return None, "Invalid number. Try again (example: 0.12)."
+
+    if min_value is not None:
+        if allow_zero:
+            if val < min_value:
+                return None, f"Value must be >= {min_value}."
+        elif val <= min_value:
+            return None, f"Value must be > {min_value}."
 
-        if min_value is not None:
-            if allow_zero:
-                if val < min_value:
-                    print(f"Value must be >= {min_value}.")
-                    continue
-            else:
-                if val <= min_value:
-                    print(f"Value must be > {min_value}.")
-                    continue
+    return val, ""
 
+def _prompt_float_slow(prompt: str, error: str, min_value: float | None, allow_zero: bool) -> float:
+    while True:
+        print(error)
+        val, error = _parse_float(input(prompt).strip(), min_value, allow_zero)
+        if val is not None:
+            return val
+
+def prompt_float(prompt: str, min_value: float | None = None, allow_zero: bool = False) -> float:
+    # fast path: valid input on the first try needs no loop
+    val, error = _parse_float(input(prompt).strip(), min_value, allow_zero)
+    if val is not None:
         return val
+    return _prompt_float_slow(prompt, error, min_value, allow_zero)
 
 def prompt_yes_no(prompt: str) -> bool:
     while True:
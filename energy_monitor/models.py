@@ -1,9 +1,74 @@
+from __future__ import annotations
+from array import array
 from dataclasses import dataclass
+from typing import Dict, Iterable, List, NamedTuple
 
-@dataclass
+from .calculations import DAYS_PER_MONTH, DAYS_PER_WEEK, WH_PER_KWH
+
+@dataclass(slots=True, frozen=True)
 class Device:
     device_id: str
     name: str
     wattage: float                
     avg_hours_per_day: float       
-    room_location: str
\ No newline at end of file
+    room_location: str
+
+class DeviceCosts(NamedTuple):
+    daily: List[float]
+    weekly: List[float]
+    monthly: List[float]
+
+class DeviceSet:
+    """Column-wise (struct-of-arrays) view of a device list with cached kWh figures."""
+
+    def __init__(
+        self,
+        ids: List[str],
+        names: List[str],
+        wattage: Iterable[float],
+        hours: Iterable[float],
+        rooms: List[str],
+    ):
+        self.ids = ids
+        self.names = names
+        self.rooms = rooms
+        # numeric columns are packed C doubles (8 bytes each) rather than
+        # lists of boxed float objects
+        self.wattage: array[float] = array("d", wattage)
+        self.hours: array[float] = array("d", hours)
+
+        # kWh figures every report shares, computed once here. Two
+        # comprehensions are faster in CPython than one loop appending to both.
+        self.daily_kwh: array[float] = array("d", [w * h / WH_PER_KWH for w, h in zip(self.wattage, self.hours)])
+        self.monthly_kwh: array[float] = array("d", [k * DAYS_PER_MONTH for k in self.daily_kwh])
+
+        self._index_rooms()
+
+    def _index_rooms(self) -> None:
+        # factorize rooms: each distinct name is hashed once here, and
+        # grouping afterwards works on small integer codes
+        codes: Dict[str, int] = {}
+        self.room_codes = array("i", [codes.setdefault(r, len(codes)) for r in self.rooms])
+        self.room_names: List[str] = list(codes)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, i: int) -> Device:
+        # Device-shaped view of one row, for callers that still work per device
+        return Device(
+            device_id=self.ids[i],
+            name=self.names[i],
+            wattage=self.wattage[i],
+            avg_hours_per_day=self.hours[i],
+            room_location=self.rooms[i],
+        )
+
+    def costs(self, price_per_kwh: float) -> DeviceCosts:
+        # one multiply per device per period, all from the cached daily kWh
+        daily = [k * price_per_kwh for k in self.daily_kwh]
+        return DeviceCosts(
+            daily=daily,
+            weekly=[c * DAYS_PER_WEEK for c in daily],
+            monthly=[c * DAYS_PER_MONTH for c in daily],
+        )
@@ -1,106 +1,85 @@
 from __future__ import annotations
-from collections import defaultdict
+import heapq
 from typing import Dict, List, Tuple
 
-from .models import Device
-from .calculations import (
-    daily_kwh, monthly_kwh, daily_cost, weekly_cost, monthly_cost
-)
+from .calculations import DAYS_PER_MONTH, DAYS_PER_WEEK
+from .models import DeviceSet
 
-def efficiency_suggestions(device: Device) -> List[str]:
-    suggestions: List[str] = []
+def efficiency_suggestions(ds: DeviceSet) -> Dict[int, List[str]]:
+    # device index -> suggestions; devices without any are left out.
+    # Each rule is one scan over a single column.
+    out: Dict[int, List[str]] = {}
 
     # Example requirement: > 12 hours/day -> power saving mode suggestion
-    if device.avg_hours_per_day > 12:
-        suggestions.append("Consider using Power Saving Mode or reducing on-time (>12h/day).")
+    for i, h in enumerate(ds.hours):
+        if h > 12:
+            out.setdefault(i, []).append("Consider using Power Saving Mode or reducing on-time (>12h/day).")
 
     # Simple heuristic ideas
-    if device.wattage >= 1000:
-        suggestions.append("High wattage device: run during off-peak hours if available.")
-    if 0 < device.avg_hours_per_day <= 0.25:
-        suggestions.append("Usage is very low; verify hours/day is correct (data sanity check).")
-
-    return suggestions
-
-def high_usage_alerts(devices: List[Device], monthly_kwh_threshold: float) -> List[str]:
-    alerts = []
-    for d in devices:
-        mkwh = monthly_kwh(d.wattage, d.avg_hours_per_day)
-        if mkwh > monthly_kwh_threshold:
-            alerts.append(
-                f"ALERT: {d.device_id} '{d.name}' in {d.room_location} uses ~{mkwh:.2f} kWh/month "
-                f"(threshold {monthly_kwh_threshold:.2f})."
-            )
-    return alerts
-
-def device_cost_rows(devices: List[Device], price_per_kwh: float) -> List[Dict[str, str]]:
-    rows = []
-    for d in devices:
-        rows.append({
-            "id": d.device_id,
-            "name": d.name,
-            "room": d.room_location,
-            "wattage_w": f"{d.wattage:.0f}",
-            "hours_day": f"{d.avg_hours_per_day:.2f}",
-            "daily_kwh": f"{daily_kwh(d.wattage, d.avg_hours_per_day):.3f}",
-            "daily_cost": f"{daily_cost(d.wattage, d.avg_hours_per_day, price_per_kwh):.2f}",
-            "weekly_cost": f"{weekly_cost(d.wattage, d.avg_hours_per_day, price_per_kwh):.2f}",
-            "monthly_cost": f"{monthly_cost(d.wattage, d.avg_hours_per_day, price_per_kwh):.2f}",
-        })
-    return rows
-
-def totals(devices: List[Device], price_per_kwh: float) -> Dict[str, float]:
+    for i, w in enumerate(ds.wattage):
+        if w >= 1000:
+            out.setdefault(i, []).append("High wattage device: run during off-peak hours if available.")
+    for i, h in enumerate(ds.hours):
+        if 0 < h <= 0.25:
+            out.setdefault(i, []).append("Usage is very low; verify hours/day is correct (data sanity check).")
+
+    return out
+
+def high_usage_alerts(ds: DeviceSet, monthly_kwh_threshold: float) -> List[str]:
+    mkwh = ds.monthly_kwh
+    return [
+        f"ALERT: {ds.ids[i]} '{ds.names[i]}' in {ds.rooms[i]} uses ~{mkwh[i]:.2f} kWh/month "
+        f"(threshold {monthly_kwh_threshold:.2f})."
+        for i in range(len(ds)) if mkwh[i] > monthly_kwh_threshold
+    ]
+
+def totals(ds: DeviceSet, price_per_kwh: float) -> Dict[str, float]:
+    # sum per-device costs so rounding matches the printed per-device columns
+    c = ds.costs(price_per_kwh)
     total_daily = 0.0
     total_weekly = 0.0
     total_monthly = 0.0
-
-    for d in devices:
-        total_daily += daily_cost(d.wattage, d.avg_hours_per_day, price_per_kwh)
-        total_weekly += weekly_cost(d.wattage, d.avg_hours_per_day, price_per_kwh)
-        total_monthly += monthly_cost(d.wattage, d.avg_hours_per_day, price_per_kwh)
+    for daily, weekly, monthly in zip(c.daily, c.weekly, c.monthly):
+        total_daily += daily
+        total_weekly += weekly
+        total_monthly += monthly
 
     return {"daily": total_daily, "weekly": total_weekly, "monthly": total_monthly}
 
-def room_monthly_totals(devices: List[Device], price_per_kwh: float) -> Dict[str, float]:
-    by_room = defaultdict(float)
-    for d in devices:
-        by_room[d.room_location] += monthly_cost(d.wattage, d.avg_hours_per_day, price_per_kwh)
-    return dict(by_room)
+def room_monthly_totals(ds: DeviceSet, price_per_kwh: float) -> Dict[str, float]:
+    sums = [0.0] * len(ds.room_names)
+    for code, mcost in zip(ds.room_codes, ds.costs(price_per_kwh).monthly):
+        sums[code] += mcost
+    return dict(zip(ds.room_names, sums))
 
 def format_table(headers: List[str], rows: List[List[str]]) -> str:
     # simple fixed-width table
-    widths = [len(h) for h in headers]
-    for r in rows:
-        for i, cell in enumerate(r):
-            widths[i] = max(widths[i], len(cell))
-
-    def fmt_row(r: List[str]) -> str:
-        return " | ".join(r[i].ljust(widths[i]) for i in range(len(headers)))
+    widths = [max(len(h), max((len(r[c]) for r in rows), default=0)) for c, h in enumerate(headers)]
 
+    # one template per table, so each row is a single str.format call
+    row_fmt = " | ".join(f"{{:<{w}}}" for w in widths)
     sep = "-+-".join("-" * w for w in widths)
 
-    out = []
-    out.append(fmt_row(headers))
-    out.append(sep)
-    for r in rows:
-        out.append(fmt_row(r))
+    out = [row_fmt.format(*headers), sep]
+    out.extend([row_fmt.format(*r) for r in rows])
     return "\n".join(out)
 
-def build_cost_report_text(devices: List[Device], price_per_kwh: float, extra_daily_cost: float) -> str:
-    rows = device_cost_rows(devices, price_per_kwh)
+def build_cost_report_text(ds: DeviceSet, price_per_kwh: float, extra_daily_cost: float) -> str:
+    c = ds.costs(price_per_kwh)
+    ids, names, rooms, wattage, hours, dkwh = ds.ids, ds.names, ds.rooms, ds.wattage, ds.hours, ds.daily_kwh
+    dcost, wcost, mcost = c.daily, c.weekly, c.monthly
 
     headers = ["ID", "Name", "Room", "W(W)", "Hrs/Day", "kWh/Day", "Daily", "Weekly", "Monthly"]
-    table_rows = []
-    for r in rows:
-        table_rows.append([
-            r["id"], r["name"], r["room"], r["wattage_w"], r["hours_day"],
-            r["daily_kwh"], r["daily_cost"], r["weekly_cost"], r["monthly_cost"]
-        ])
-
-    t = totals(devices, price_per_kwh)
+    table_rows = [
+        [ids[i], names[i], rooms[i], f"{wattage[i]:.0f}", f"{hours[i]:.2f}",
+         f"{dkwh[i]:.3f}", f"{dcost[i]:.2f}", f"{wcost[i]:.2f}", f"{mcost[i]:.2f}"]
+        for i in range(len(ds))
+    ]
+
+    t = totals(ds, price_per_kwh)
     # include user additional daily cost (e.g., fixed service charge)
-    extra_weekly = extra_daily_cost * 7
-    extra_monthly = extra_daily_cost * 30
+    extra_weekly = extra_daily_cost * DAYS_PER_WEEK
+    extra_monthly = extra_daily_cost * DAYS_PER_MONTH
 
     report = []
     report.append("SMART HOME ENERGY MONITOR - COST REPORT")
@@ -124,17 +103,16 @@ def build_cost_report_text(devices: List[Device], price_per_kwh: float, extra_da
     report.append(f"  Monthly: {(t['monthly'] + extra_monthly):.2f}")
     report.append("")
     report.append("EFFICIENCY SUGGESTIONS:")
-    for d in devices:
-        sugg = efficiency_suggestions(d)
-        if sugg:
-            report.append(f"- {d.device_id} {d.name} ({d.room_location}):")
-            for s in sugg:
-                report.append(f"    * {s}")
+    suggestions = efficiency_suggestions(ds)
+    for i in sorted(suggestions):
+        report.append(f"- {ids[i]} {names[i]} ({rooms[i]}):")
+        for s in suggestions[i]:
+            report.append(f"    * {s}")
     return "\n".join(report)
 
-def build_monthly_forecast_text(devices: List[Device], price_per_kwh: float, extra_daily_cost: float) -> str:
-    room_totals = room_monthly_totals(devices, price_per_kwh)
-    extra_monthly = extra_daily_cost * 30
+def build_monthly_forecast_text(ds: DeviceSet, price_per_kwh: float, extra_daily_cost: float) -> str:
+    room_totals = room_monthly_totals(ds, price_per_kwh)
+    extra_monthly = extra_daily_cost * DAYS_PER_MONTH
 
     headers = ["Room", "Expected Monthly Cost"]
     rows = [[room, f"{cost:.2f}"] for room, cost in sorted(room_totals.items(), key=lambda x: x[0].lower())]
@@ -154,25 +132,22 @@ def build_monthly_forecast_text(devices: List[Device], price_per_kwh: float, ext
     out.append(f"Forecast grand total:  {grand_total:.2f}")
     return "\n".join(out)
 
-def build_predictions_text(devices: List[Device], price_per_kwh: float) -> str:
+def build_predictions_text(ds: DeviceSet, price_per_kwh: float) -> str:
     # "prediction" here is a simple projection:
     # - monthly kWh and monthly cost per device
     # - top 3 devices by monthly cost
-    preds = []
-    for d in devices:
-        mkwh = monthly_kwh(d.wattage, d.avg_hours_per_day)
-        mcost = mkwh * price_per_kwh
-        preds.append((mcost, d, mkwh))
-
-    preds.sort(reverse=True, key=lambda x: x[0])
-    top3 = preds[:3]
+    mkwh = ds.monthly_kwh
+    # monthly kWh * price, as the projection has always been computed
+    mcost = [k * price_per_kwh for k in mkwh]
+    # partial selection instead of sorting every device; ties keep file order
+    top_idx = heapq.nlargest(3, range(len(ds)), key=mcost.__getitem__)
 
     out = []
     out.append("PREDICTIONS / INSIGHTS")
     out.append("")
     out.append("Top devices by expected monthly cost:")
-    for rank, (mcost, d, mkwh) in enumerate(top3, start=1):
-        out.append(f"{rank}. {d.device_id} {d.name} ({d.room_location}) -> {mkwh:.2f} kWh/mo, {mcost:.2f}/mo")
+    for rank, i in enumerate(top_idx, start=1):
+        out.append(f"{rank}. {ds.ids[i]} {ds.names[i]} ({ds.rooms[i]}) -> {mkwh[i]:.2f} kWh/mo, {mcost[i]:.2f}/mo")
 
     out.append("")
     out.append("Note: This is a simple projection based on average daily hours (no time-series learning).")
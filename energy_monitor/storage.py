@@ -1,70 +1,106 @@
 from __future__ import annotations
+import sys
+from array import array
 from pathlib import Path
 from typing import List, Tuple
-from .models import Device
+from .models import DeviceSet
 from .calculations import validate_device_values
 
 class DataFileError(Exception):
     """Raised when appliance file content/format is invalid."""
 
-def load_devices(file_path: str) -> List[Device]:
+def load_devices(file_path: str) -> DeviceSet:
     path = Path(file_path)
 
     if not path.exists():
         raise FileNotFoundError(f"Appliance file not found: {file_path}")
 
-    devices: List[Device] = []
-    seen_ids = set()
+    # parsed straight into columns; no per-line row lists are kept
+    line_nos: array[int] = array("l")
+    ids: List[str] = []
+    names: List[str] = []
+    wattage_s: List[str] = []
+    hours_s: List[str] = []
+    rooms: List[str] = []
+    format_error: DataFileError | None = None
 
-    lines = path.read_text(encoding="utf-8").splitlines()
-    for line_no, raw in enumerate(lines, start=1):
-        line = raw.strip()
-        if not line or line.startswith("#"):
-            continue
+    # stream the file instead of holding the whole text plus its line list
+    with path.open("r", encoding="utf-8") as fh:
+        for line_no, raw in enumerate(fh, start=1):
+            line = raw.strip()
+            if not line or line.startswith("#"):
+                continue
 
-        parts = [p.strip() for p in line.split("|")]
-        if len(parts) != 5:
-            raise DataFileError(
-                f"Line {line_no}: expected 5 fields separated by '|', got {len(parts)}. "
-                f"Bad line: {raw}"
-            )
+            parts = line.split("|")
+            if len(parts) != 5:
+                # earlier lines may hold an error that must win; report after checking them
+                bad_line = raw.rstrip("\r\n")
+                format_error = DataFileError(
+                    f"Line {line_no}: expected 5 fields separated by '|', got {len(parts)}. "
+                    f"Bad line: {bad_line}"
+                )
+                break
+
+            device_id, name, wattage, hours, room = parts
+            line_nos.append(line_no)
+            ids.append(device_id.strip())
+            # names and rooms repeat across devices; interning makes each
+            # distinct value a single shared object
+            names.append(sys.intern(name.strip() or "Unknown"))
+            wattage_s.append(wattage.strip())
+            hours_s.append(hours.strip())
+            rooms.append(sys.intern(room.strip() or "Unknown"))
 
-        device_id, name, wattage_s, hours_s, room = parts
+    if not ids:
+        raise format_error or DataFileError("No valid devices found in appliances file.")
+
+    # fast whole-column checks; only when one fails, the per-line pass that
+    # locates the first bad line
+    wattages: array[float] | None = None
+    hours: array[float] | None = None
+    if "" not in ids and len(set(ids)) == len(ids):
+        try:
+            wattages = array("d", map(float, wattage_s))
+            hours = array("d", map(float, hours_s))
+        except ValueError:
+            wattages = hours = None
+    # any() rather than min()/max(): a NaN can hide an out-of-range value from min()
+    if wattages is None or hours is None or any(w <= 0 for w in wattages) or any(h < 0 or h > 24 for h in hours):
+        _validate_rows(line_nos, ids, wattage_s, hours_s)
+        # the column checks and _validate_rows apply the same rules
+        raise DataFileError("Appliance file failed validation.")
 
+    if format_error is not None:
+        raise format_error
+
+    return DeviceSet(ids=ids, names=names, wattage=wattages, hours=hours, rooms=rooms)
+
+def _validate_rows(line_nos: array[int], ids: List[str], wattage_s: List[str], hours_s: List[str]) -> None:
+    # per-line checks in file order, so the first bad line is the one reported
+    seen_ids = set()
+    for line_no, device_id, w_s, h_s in zip(line_nos, ids, wattage_s, hours_s):
         if not device_id:
             raise DataFileError(f"Line {line_no}: device_id cannot be empty.")
         if device_id in seen_ids:
             raise DataFileError(f"Line {line_no}: duplicate device_id '{device_id}'.")
 
         try:
-            wattage = float(wattage_s)
-            hours = float(hours_s)
+            wattage = float(w_s)
+            hours = float(h_s)
         except ValueError:
             raise DataFileError(
                 f"Line {line_no}: wattage and avg_hours_per_day must be numbers. "
-                f"Got wattage='{wattage_s}', hours='{hours_s}'."
+                f"Got wattage='{w_s}', hours='{h_s}'."
             )
 
         validate_device_values(wattage, hours)
-
-        devices.append(Device(
-            device_id=device_id,
-            name=name or "Unknown",
-            wattage=wattage,
-            avg_hours_per_day=hours,
-            room_location=room or "Unknown"
-        ))
         seen_ids.add(device_id)
 
-    if not devices:
-        raise DataFileError("No valid devices found in appliances file.")
-
-    return devices
-
 def ensure_output_dir(output_dir: str) -> Path:
     p = Path(output_dir)
     p.mkdir(parents=True, exist_ok=True)
     return p
 
 def write_text(output_path: str, content: str) -> None:
-    Path(output_path).write_text(content, encoding="utf-8")
\ No newline at end of file
+    # encode once and hand the OS a single buffer
+    Path(output_path).write_bytes(content.encode("utf-8"))
\ No newline at end of file
@@ -1,4 +1,6 @@
 from __future__ import annotations
+import sys
+from typing import List
 
 from energy_monitor.storage import (
     load_devices, ensure_output_dir, write_text, DataFileError
@@ -13,12 +15,18 @@ from energy_monitor.cli import prompt_float, prompt_yes_no
 APPLIANCES_FILE = "appliances.txt"
 OUTPUT_DIR = "output"
 
+def flush_lines(parts: List[str]) -> None:
+    # one write for a block of lines instead of one print() per line
+    if parts:
+        sys.stdout.write("\n".join(parts) + "\n")
+        parts.clear()
+
 def main() -> None:
     print("Smart Home Energy Monitor (CLI)")
     print("Loading devices from appliances.txt ...")
 
     try:
-        devices = load_devices(APPLIANCES_FILE)
+        ds = load_devices(APPLIANCES_FILE)
     except FileNotFoundError as e:
         print(f"ERROR: {e}")
         print("Fix: Ensure appliances.txt exists in the project folder.")
@@ -35,7 +43,7 @@ def main() -> None:
         print(f"Unexpected error while loading devices: {e}")
         return
 
-    print(f"Loaded {len(devices)} devices.\n")
+    print(f"Loaded {len(ds)} devices.\n")
 
     price_per_kwh = prompt_float("Enter price per kWh (example 0.12): ", min_value=0.0, allow_zero=False)
     try:
@@ -59,28 +67,29 @@ def main() -> None:
 
     out_dir = ensure_output_dir(OUTPUT_DIR)
 
-    cost_report = build_cost_report_text(devices, price_per_kwh, extra_daily_cost)
-    forecast_report = build_monthly_forecast_text(devices, price_per_kwh, extra_daily_cost)
-    predictions_report = build_predictions_text(devices, price_per_kwh)
+    cost_report = build_cost_report_text(ds, price_per_kwh, extra_daily_cost)
+    forecast_report = build_monthly_forecast_text(ds, price_per_kwh, extra_daily_cost)
+    predictions_report = build_predictions_text(ds, price_per_kwh)
 
     # Alerts (only if threshold > 0)
     if threshold_kwh > 0:
-        alerts = high_usage_alerts(devices, monthly_kwh_threshold=threshold_kwh)
+        alerts = high_usage_alerts(ds, monthly_kwh_threshold=threshold_kwh)
     else:
         alerts = []
 
-    # Print to terminal
-    print("\n" + "=" * 70)
-    print(cost_report)
+    # Print to terminal (buffered; flushed before each prompt so ordering is kept)
+    parts = ["\n" + "=" * 70, cost_report]
     if alerts:
-        print("\nALERTS:")
+        parts.append("\nALERTS:")
         for a in alerts:
-            print(" - " + a)
+            parts.append(" - " + a)
+            flush_lines(parts)
             if prompt_yes_no("Do you want a reduction warning message for this device?"):
-                print("   REDUCE USAGE: Try lowering hours/day or using eco mode / timers.\n")
-    print("=" * 70)
-    print("\n" + forecast_report)
-    print("\n" + predictions_report)
+                parts.append("   REDUCE USAGE: Try lowering hours/day or using eco mode / timers.\n")
+    parts.append("=" * 70)
+    parts.append("\n" + forecast_report)
+    parts.append("\n" + predictions_report)
+    flush_lines(parts)
 
     # Save outputs
     try:
@@ -94,11 +103,13 @@ def main() -> None:
         print(f"ERROR: File write failed: {e}")
         return
 
-    print("\nSaved reports to:")
-    print(f" - {out_dir / 'costs_report.txt'}")
-    print(f" - {out_dir / 'monthly_forecast.txt'}")
-    print(f" - {out_dir / 'predictions.txt'}")
-    print("\nDone.")
+    flush_lines([
+        "\nSaved reports to:",
+        f" - {out_dir / 'costs_report.txt'}",
+        f" - {out_dir / 'monthly_forecast.txt'}",
+        f" - {out_dir / 'predictions.txt'}",
+        "\nDone.",
+    ])
 
 if __name__ == "__main__":
     main()
\ No newline at end of file